@@ -411,9 +411,10 @@ def main():
             logger.info("Scientific outputs:")
             for name, item in result["scientific"].items():
                 logger.info(
-                    "  %s -> %s (gee_task_id=%s)",
+                    "  %s -> %s (tiles: %s) (gee_task_id=%s)",
                     name,
                     item["url"],
+                    item.get("tile_url_pattern"),
                     item.get("gee_task_id"),
                 )
 
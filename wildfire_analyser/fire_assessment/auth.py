@@ -14,10 +14,25 @@
 #   duration required by the Earth Engine client library.
 # - This module intentionally avoids interactive authentication flows
 #   (e.g., OAuth browser login).
+# - The pipeline issues many concurrent, automated requests (thumbnails,
+#   exports, statistics), so the client is initialized against the
+#   high-volume endpoint by default. That endpoint is designed for parallel
+#   request fan-out but caps each response at 32 MB and does not cache;
+#   interactive single-shot tools (e.g. gee_task_monitor) keep the default
+#   endpoint.
+# - The Earth Engine client already reuses one persistent HTTP session for
+#   all calls. Under parallel fan-out, rate-limited (429) and transient 5xx
+#   responses are expected, so the client's exponential-backoff retry budget
+#   is raised to MAX_RETRIES.
 #
 # Responsibilities of this module:
 # - Load environment variables from an optional .env file.
 # - Validate and parse the service account JSON credentials.
+# - Classify failures by exception type: a GEE_PRIVATE_KEY_JSON that is not
+#   a JSON object with a client_email raises ValueError; key material
+#   rejected by Google auth (e.g. a malformed private key), Earth Engine
+#   initialization failures and temporary key file errors raise
+#   RuntimeError; programming errors propagate unchanged.
 # - Initialize the Earth Engine client with service account credentials.
 #
 # Copyright (C) 2025
@@ -31,13 +46,23 @@ import ee
 import os
 import json
 from dotenv import load_dotenv
+from google.auth.exceptions import GoogleAuthError
 from tempfile import NamedTemporaryFile
 
+# Retries (with exponential backoff) for rate-limited or transient errors.
+MAX_RETRIES = 8
 
-def authenticate_gee(gee_key_json: str | None = None) -> None:
+
+def authenticate_gee(
+    gee_key_json: str | None = None,
+    high_volume: bool = True,
+) -> None:
     """
     Authenticate Google Earth Engine using a service account JSON
     stored in the GEE_PRIVATE_KEY_JSON environment variable.
+
+    When high_volume is True the client targets the Earth Engine
+    high-volume endpoint, which suits parallel automated requests.
     """
 
     try:
@@ -45,14 +70,23 @@ def authenticate_gee(gee_key_json: str | None = None) -> None:
     except json.JSONDecodeError as e:
         raise ValueError("Invalid GEE_PRIVATE_KEY_JSON format") from e
 
+    if not isinstance(key_dict, dict):
+        raise ValueError("GEE_PRIVATE_KEY_JSON must be a JSON object")
+
+    client_email = key_dict.get("client_email")
+    if not client_email:
+        raise ValueError("GEE_PRIVATE_KEY_JSON is missing 'client_email'")
+
     try:
         with NamedTemporaryFile(mode="w+", suffix=".json") as f:
             json.dump(key_dict, f)
             f.flush()
-            credentials = ee.ServiceAccountCredentials(
-                key_dict["client_email"], f.name
+            credentials = ee.ServiceAccountCredentials(client_email, f.name)
+            ee.Initialize(
+                credentials,
+                url=ee.data.HIGH_VOLUME_API_BASE_URL if high_volume else None,
             )
-            ee.Initialize(credentials)
-    except Exception as e:
+            ee.data.setMaxRetries(MAX_RETRIES)
+    except (ee.EEException, GoogleAuthError, ValueError, OSError) as e:
         raise RuntimeError(
             "Failed to authenticate with Google Earth Engine") from e
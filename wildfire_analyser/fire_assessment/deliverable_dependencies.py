@@ -67,13 +67,14 @@ DELIVERABLE_DEPENDENCIES = {
     # Visual deliverables (qualitative representations)
     #
     # Visual deliverables reuse the same scientific dependencies as their
-    # analytical counterparts but differ only in representation. They are
-    # intended for preview, reporting, and qualitative inspection.
+    # analytical counterparts but differ only in representation. Severity
+    # maps reuse the classified severity shared with the statistics. They
+    # are intended for preview, reporting, and qualitative inspection.
     # ------------------------------------------------------------------
 
     Deliverable.RGB_PRE_FIRE_VISUAL: {Dependency.RGB_PRE_FIRE},
     Deliverable.RGB_POST_FIRE_VISUAL: {Dependency.RGB_POST_FIRE},
-    Deliverable.DNDVI_VISUAL: {Dependency.DNDVI},
-    Deliverable.RBR_VISUAL: {Dependency.RBR},
-    Deliverable.DNBR_VISUAL: {Dependency.DNBR},
+    Deliverable.DNDVI_VISUAL: {Dependency.DNDVI_SEVERITY},
+    Deliverable.RBR_VISUAL: {Dependency.RBR_SEVERITY},
+    Deliverable.DNBR_VISUAL: {Dependency.DNBR_SEVERITY},
 }
@@ -86,6 +86,16 @@ class Dependency(Enum):
 
     RBR = auto()
 
+    # ─────────────────────────────────────────────
+    # Burn severity classes (discrete values)
+    #
+    # Classified severity maps shared by the
+    # statistical and visual deliverables.
+    # ─────────────────────────────────────────────
+    DNBR_SEVERITY = auto()
+    DNDVI_SEVERITY = auto()
+    RBR_SEVERITY = auto()
+
     # ─────────────────────────────────────────────
     # Fire severity metrics (aggregated statistics)
     #
@@ -125,6 +125,22 @@ DEPENDENCY_GRAPH = {
         Dependency.NBR_PRE_FIRE,
     },
 
+    # ─────────────────────────────────────────────
+    # Fire severity classes
+    #
+    # Discrete severity maps classified once and
+    # shared by statistics and visual products.
+    # ─────────────────────────────────────────────
+    Dependency.DNBR_SEVERITY: {
+        Dependency.DNBR,
+    },
+    Dependency.DNDVI_SEVERITY: {
+        Dependency.DNDVI,
+    },
+    Dependency.RBR_SEVERITY: {
+        Dependency.RBR,
+    },
+
     # ─────────────────────────────────────────────
     # Fire severity statistics
     #
@@ -132,12 +148,12 @@ DEPENDENCY_GRAPH = {
     # burn severity indices.
     # ─────────────────────────────────────────────
     Dependency.DNBR_AREA_STATISTICS: {
-        Dependency.DNBR,
+        Dependency.DNBR_SEVERITY,
     },
     Dependency.DNDVI_AREA_STATISTICS: {
-        Dependency.DNDVI,
+        Dependency.DNDVI_SEVERITY,
     },
     Dependency.RBR_AREA_STATISTICS: {
-        Dependency.RBR,
+        Dependency.RBR_SEVERITY,
     },
 }
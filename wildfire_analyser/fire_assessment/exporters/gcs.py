@@ -12,11 +12,28 @@
 #   separately via the Earth Engine task API or console.
 # - This module is intentionally limited to storage concerns and does not
 #   perform scientific processing or visualization logic.
+# - Large regions are never degraded to a coarser scale. Earth Engine
+#   splits the output into a grid of FILE_DIMENSIONS-sized GeoTIFF tiles
+#   (named <object_name>-<row>-<col>.tif) computed in parallel server-side.
+# - The image is not clipped, so exports cover the whole bounding box of
+#   the ROI. skipEmptyTiles only drops tiles whose pixels are all masked;
+#   tiles over the box corners outside the polygon are still written.
+# - Whether an export is tiled is only known once the task has run, so both
+#   references are returned: "url" names the single-file output, and
+#   "tile_url_pattern" matches the tiles written instead when the output
+#   exceeds FILE_DIMENSIONS.
+# - GeoTIFFs are written as Cloud-Optimized GeoTIFFs (internally tiled,
+#   compressed, with overviews) so viewers can stream and zoom them
+#   without downloading the full file.
+# - Scientific products (reflectance, NDVI, NBR and derived indices) carry
+#   far less precision than float64. Scaled reflectance is promoted to
+#   float64 by Earth Engine, so images are cast to float32 before export,
+#   halving the payload without affecting reported values.
 #
 # Responsibilities of this module:
 # - Submit GeoTIFF export tasks to Google Cloud Storage.
-# - Define export parameters (region, scale, maxPixels, format).
-# - Return stable references (GCS URL and task ID) for downstream consumers.
+# - Define export parameters (region, scale, maxPixels, format, tiling).
+# - Return stable references (GCS URLs and task ID) for downstream consumers.
 #
 # Copyright (C) 2025
 # Marcelo Camargo
@@ -27,6 +44,10 @@
 
 import ee
 
+# Tile edge length (pixels) for exports that exceed a single file. Must be
+# a multiple of the export shard size (256).
+FILE_DIMENSIONS = 32768
+
 
 def export_geotiff_to_gcs(
     image: ee.Image,
@@ -36,7 +57,7 @@ def export_geotiff_to_gcs(
     scale: int
 ) -> dict:
     task = ee.batch.Export.image.toCloudStorage(
-        image=image,
+        image=image.toFloat(),
         description=object_name,
         bucket=bucket,
         fileNamePrefix=object_name,
@@ -44,10 +65,16 @@ def export_geotiff_to_gcs(
         scale=scale,
         maxPixels=1e13,
         fileFormat="GeoTIFF",
+        fileDimensions=FILE_DIMENSIONS,
+        skipEmptyTiles=True,
+        formatOptions={"cloudOptimized": True},
     )
     task.start()
 
+    base_url = f"https://storage.googleapis.com/{bucket}/{object_name}"
+
     return {
-        "url": f"https://storage.googleapis.com/{bucket}/{object_name}.tif",
+        "url": f"{base_url}.tif",
+        "tile_url_pattern": f"{base_url}-*-*.tif",
         "gee_task_id": task.id,
     }
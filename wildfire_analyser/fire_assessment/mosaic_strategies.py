@@ -24,6 +24,8 @@ import ee
 from enum import Enum
 import ee
 
+from wildfire_analyser.fire_assessment.sentinel2 import QA_BANDS, SPECTRAL_BANDS
+
 
 class MosaicStrategy(str, Enum):
     """
@@ -164,10 +166,9 @@ def cloud_masked_light_mosaic(
     masked = collection.map(_mask_scl_light)
     mosaic = _pixel_mosaic_by_cloud_prob(masked)
 
-    # Remove auxiliary quality band from output
-    return mosaic.select(
-        mosaic.bandNames().remove("quality")
-    )
+    # Remove auxiliary quality band from output. The band list is known
+    # statically, so no server-side bandNames() list operation is needed.
+    return mosaic.select(SPECTRAL_BANDS + QA_BANDS)
 
 def best_date_masked_mosaic(
     collection: ee.ImageCollection,
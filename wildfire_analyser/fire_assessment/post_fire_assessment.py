@@ -23,6 +23,7 @@
  
 
 import ee
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import List, Dict, Any
 from datetime import datetime, date
@@ -43,10 +44,28 @@ from wildfire_analyser.fire_assessment.visualization import (
     get_visual_thumbnail_url,
 )
 from wildfire_analyser.fire_assessment.dependencies import Dependency
+from wildfire_analyser.fire_assessment.products import compute_area_stats
 
 import logging
 
 
+# Thumbnail URL resolution, export task submission and getInfo() calls are
+# blocking REST round-trips to Earth Engine dominated by network latency.
+# Requests are fanned out over a module-level pool so that repeated runs
+# reuse the same worker threads. The Earth Engine client keeps its session
+# state process-wide, so worker threads share the main thread's
+# initialization.
+#
+# The pool is sized to the client's HTTP connection pool (requests' default
+# of 10 connections per host), so every in-flight call keeps a reusable
+# keep-alive connection instead of opening and discarding extra ones.
+IO_MAX_WORKERS = 10
+_IO_EXECUTOR = ThreadPoolExecutor(
+    max_workers=IO_MAX_WORKERS,
+    thread_name_prefix="wildfire_analyser_io",
+)
+
+
 class PostFireAssessment:
 
     DEFAULT_SCALE = 10
@@ -84,8 +103,8 @@ class PostFireAssessment:
 
         self.context = DAGExecutionContext(
             roi=self.roi,
-            start_date=start_date,
-            end_date=end_date,
+            start_date=start.isoformat(),
+            end_date=end.isoformat(),
             cloud_threshold=cloud_threshold,
             days_before_after=days_before_after,
             pre_fire_mosaic_strategy=pre_fire_mosaic_strategy,
@@ -102,17 +121,21 @@ class PostFireAssessment:
             "provenance": {},
         }
 
+        severities = {}
+        visual_futures = {}
+        export_futures = {}
+
         for d, value in outputs.items():
 
             if d.name.endswith("_AREA_STATISTICS"):
-                result["statistics"][d.name] = value
+                severities[d.name] = value
                 continue
 
             if d in VISUAL_RENDERERS:
                 vis = VISUAL_RENDERERS[d](value, self.roi)
-                result["visual"][d.name] = {
-                    "url": get_visual_thumbnail_url(vis, self.roi)
-                }
+                visual_futures[d] = _IO_EXECUTOR.submit(
+                    get_visual_thumbnail_url, vis, self.roi
+                )
                 continue
 
             if self.bucket:
@@ -122,7 +145,8 @@ class PostFireAssessment:
                     end_date=self.context.inputs["end_date"],
                 )
 
-                export_result = export_geotiff_to_gcs(
+                export_futures[d] = _IO_EXECUTOR.submit(
+                    export_geotiff_to_gcs,
                     image=value,
                     roi=self.roi,
                     bucket=self.bucket,
@@ -130,25 +154,37 @@ class PostFireAssessment:
                     scale=self.DEFAULT_SCALE,
                 )
 
-                result["scientific"][d.name] = {
-                    "url": export_result["url"],
-                    "gee_task_id": export_result["gee_task_id"],
-                }
+        # Statistics and provenance are independent getInfo() round-trips;
+        # they run alongside the thumbnail and export requests.
+        statistics_future = (
+            _IO_EXECUTOR.submit(compute_area_stats, severities, self.roi)
+            if severities else None
+        )
 
         # Provenance (image IDs, dates, cloud %)
-        pre_collection = self.context.get(Dependency.PRE_FIRE_COLLECTION)
-        post_collection = self.context.get(Dependency.POST_FIRE_COLLECTION)
-
-        result["provenance"] = {
-            "pre_fire": {
-                "images": self._extract_collection_provenance(pre_collection)
-                if pre_collection is not None else []
-            },
-            "post_fire": {
-                "images": self._extract_collection_provenance(post_collection)
-                if post_collection is not None else []
+        provenance_future = _IO_EXECUTOR.submit(
+            self._extract_provenance,
+            {
+                "pre_fire": self.context.get(Dependency.PRE_FIRE_COLLECTION),
+                "post_fire": self.context.get(Dependency.POST_FIRE_COLLECTION),
             },
-        }
+        )
+
+        for d, future in export_futures.items():
+            export_result = future.result()
+            result["scientific"][d.name] = {
+                "url": export_result["url"],
+                "tile_url_pattern": export_result["tile_url_pattern"],
+                "gee_task_id": export_result["gee_task_id"],
+            }
+
+        for d, future in visual_futures.items():
+            result["visual"][d.name] = {"url": future.result()}
+
+        if statistics_future is not None:
+            result["statistics"] = statistics_future.result()
+
+        result["provenance"] = provenance_future.result()
 
         return result
 
@@ -185,12 +221,39 @@ class PostFireAssessment:
                 f"{field_name} must be in YYYY-MM-DD format (got '{value}')"
             ) from e
 
+    @classmethod
+    def _extract_provenance(
+        cls,
+        collections: Dict[str, ee.ImageCollection | None],
+    ) -> Dict[str, Dict[str, List[Dict[str, Any]]]]:
+        """
+        Extract image provenance for several ImageCollections at once.
+
+        All collections are resolved in a single getInfo() round-trip.
+        Collections that were not computed yield an empty image list.
+        """
+        available = {
+            key: cls._collection_provenance(collection)
+            for key, collection in collections.items()
+            if collection is not None
+        }
+        info = ee.Dictionary(available).getInfo() if available else {}
+
+        return {
+            key: {
+                "images": [
+                    f["properties"] for f in info[key]["features"]
+                ] if key in info else []
+            }
+            for key in collections
+        }
+
     @staticmethod
-    def _extract_collection_provenance(
+    def _collection_provenance(
         collection: ee.ImageCollection,
-    ) -> List[Dict[str, Any]]:
+    ) -> ee.FeatureCollection:
         """
-        Extract ordered image provenance from an ImageCollection.
+        Build ordered image provenance from an ImageCollection.
 
         The order reflects the ImageCollection internal ordering
         (i.e., sorted by CLOUDY_PIXEL_PERCENTAGE).
@@ -207,7 +270,4 @@ class PostFireAssessment:
                 },
             )
 
-        feature_collection = ee.FeatureCollection(collection.map(to_feature))
-        features = feature_collection.getInfo()["features"]
-
-        return [f["properties"] for f in features]
+        return ee.FeatureCollection(collection.map(to_feature))
@@ -33,10 +33,18 @@ import ee
 
 from wildfire_analyser.fire_assessment.dependencies import Dependency
 from wildfire_analyser.fire_assessment.time_windows import compute_fire_time_windows
-from wildfire_analyser.fire_assessment.sentinel2 import gather_collection
+from wildfire_analyser.fire_assessment.sentinel2 import (
+    add_reflectance_bands,
+    gather_collection,
+)
 from wildfire_analyser.fire_assessment.mosaic_strategies import (
     apply_mosaic_strategy,
 )
+from wildfire_analyser.fire_assessment.severity import (
+    classify_dnbr_severity,
+    classify_dndvi_severity,
+    classify_rbr_severity,
+)
 
 ProductExecutor = Callable[[Any], Any]
 PRODUCT_REGISTRY: Dict[Dependency, ProductExecutor] = {}
@@ -113,12 +121,14 @@ def build_pre_fire_mosaic(context):
         "naive",
     )
 
-    return apply_mosaic_strategy(
+    mosaic = apply_mosaic_strategy(
         pre_collection,
         strategy,
         context,
     )
 
+    return add_reflectance_bands(mosaic)
+
 
 @register(Dependency.POST_FIRE_MOSAIC)
 def build_post_fire_mosaic(context):
@@ -131,12 +141,14 @@ def build_post_fire_mosaic(context):
         "naive",
     )
 
-    return apply_mosaic_strategy(
+    mosaic = apply_mosaic_strategy(
         post_collection,
         strategy,
         context,
     )
 
+    return add_reflectance_bands(mosaic)
+
 
 @register(Dependency.RGB_PRE_FIRE)
 def build_rgb_pre_fire(context):
@@ -292,7 +304,38 @@ def compute_rbr(context):
     return rbr
 
 # ─────────────────────────────
-# Stage 5 – STATISTICS
+# Stage 5 – SEVERITY
+# ─────────────────────────────
+
+
+@register(Dependency.DNBR_SEVERITY)
+def classify_dnbr(context):
+    dnbr = context.get(Dependency.DNBR)
+    if dnbr is None:
+        raise RuntimeError("DNBR not available")
+
+    return classify_dnbr_severity(dnbr)
+
+
+@register(Dependency.DNDVI_SEVERITY)
+def classify_dndvi(context):
+    dndvi = context.get(Dependency.DNDVI)
+    if dndvi is None:
+        raise RuntimeError("DNDVI not available")
+
+    return classify_dndvi_severity(dndvi)
+
+
+@register(Dependency.RBR_SEVERITY)
+def classify_rbr(context):
+    rbr = context.get(Dependency.RBR)
+    if rbr is None:
+        raise RuntimeError("RBR not available")
+
+    return classify_rbr_severity(rbr)
+
+# ─────────────────────────────
+# Stage 6 – STATISTICS
 # ─────────────────────────────
 
 
@@ -305,20 +348,19 @@ SEVERITY_LABELS = {
 }
 
 
-def format_area_statistics(stats):
+def format_area_statistics(areas: Dict[int, float]):
     """
-    Convert EE grouped reduce output into paper-ready statistics.
+    Convert per-class areas (ha, keyed by severity class) into paper-ready
+    statistics.
     """
-    total_area = sum(item["sum"] for item in stats)
-    burned_area = sum(
-        item["sum"] for item in stats if item["severity_class"] > 0
-    )
+    total_area = sum(areas.values())
+    burned_area = total_area - areas.get(0, 0)
 
     result = {}
 
-    for item in stats:
-        label = SEVERITY_LABELS[item["severity_class"]]
-        area = item["sum"]
+    for severity_class in sorted(areas):
+        label = SEVERITY_LABELS[severity_class]
+        area = areas[severity_class]
         ratio = (area / total_area) * 100 if total_area > 0 else 0
 
         result[label] = {
@@ -339,7 +381,19 @@ def format_area_statistics(stats):
     return result
 
 
-def compute_area_stats(severity: ee.Image, roi: ee.Geometry):
+STATS_SCALE = 10  # m
+
+
+def _area_by_severity_class(
+    severity: ee.Image,
+    roi: ee.Geometry,
+) -> ee.List:
+    """
+    Build (lazily) the area in hectares of each severity class.
+
+    Areas are summed from ee.Image.pixelArea(), so each pixel contributes
+    its true ground area regardless of the projection the reduction runs in.
+    """
     pixel_area = ee.Image.pixelArea().divide(10_000)  # m² → ha
 
     reducer = ee.Reducer.sum().group(
@@ -347,80 +401,87 @@ def compute_area_stats(severity: ee.Image, roi: ee.Geometry):
         groupName="severity_class",
     )
 
-    stats = (
+    return ee.List(
         pixel_area
         .addBands(severity)
         .reduceRegion(
             reducer=reducer,
             geometry=roi,
-            scale=10,
+            scale=STATS_SCALE,
             maxPixels=1e13,
         )
         .get("groups")
     )
 
-    stats = ee.List(stats).getInfo()
 
-    return format_area_statistics(stats)
+def compute_area_stats(
+    severities: Dict[str, ee.Image],
+    roi: ee.Geometry,
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Compute area by severity class for several classified images at once.
+
+    The area-weighted reductions of all severity images are collected in a
+    single ee.Dictionary, so every statistic is resolved in one getInfo()
+    round-trip.
+    """
+    groups_by_name = ee.Dictionary({
+        name: _area_by_severity_class(severity, roi)
+        for name, severity in severities.items()
+    }).getInfo()
+
+    result = {}
+
+    for name in severities:
+        areas = {
+            int(group["severity_class"]): group["sum"]
+            for group in groups_by_name[name]
+        }
+        result[name] = format_area_statistics(areas)
+
+    return result
 
 
 @register(Dependency.DNBR_AREA_STATISTICS)
 def compute_dnbr_area_statistics(context):
-    dnbr = context.get(Dependency.DNBR)
-    roi = context.inputs["roi"]
-
-    if dnbr is None:
-        raise RuntimeError("DNBR not available")
+    """
+    Provide the classified dNBR severity for area statistics.
 
-    severity = (
-        ee.Image(0)
-        .where(dnbr.gte(0.10).And(dnbr.lt(0.27)), 1)
-        .where(dnbr.gte(0.27).And(dnbr.lt(0.44)), 2)
-        .where(dnbr.gte(0.44).And(dnbr.lt(0.66)), 3)
-        .where(dnbr.gte(0.66), 4)
-        .rename("severity")
-        .toInt8()
-    )
+    Areas are resolved later, together with the other requested
+    statistics, by compute_area_stats().
+    """
+    severity = context.get(Dependency.DNBR_SEVERITY)
+    if severity is None:
+        raise RuntimeError("DNBR_SEVERITY not available")
 
-    return compute_area_stats(severity, roi)
+    return severity
 
 
 @register(Dependency.DNDVI_AREA_STATISTICS)
 def compute_dndvi_area_statistics(context):
-    dndvi = context.get(Dependency.DNDVI)
-    roi = context.inputs["roi"]
-
-    if dndvi is None:
-        raise RuntimeError("DNDVI not available")
+    """
+    Provide the classified dNDVI severity for area statistics.
 
-    severity = (
-        ee.Image(0)  # Unburned: dNDVI < 0.07
-        .where(dndvi.gte(0.07).And(dndvi.lt(0.10)), 1)   # Low
-        .where(dndvi.gte(0.10).And(dndvi.lt(0.20)), 1)  # Low
-        .where(dndvi.gte(0.20).And(dndvi.lt(0.33)), 2)  # Moderate
-        .where(dndvi.gte(0.33).And(dndvi.lt(0.44)), 3)  # High
-        .where(dndvi.gte(0.45), 4)                      # Very High
-    )
+    Areas are resolved later, together with the other requested
+    statistics, by compute_area_stats().
+    """
+    severity = context.get(Dependency.DNDVI_SEVERITY)
+    if severity is None:
+        raise RuntimeError("DNDVI_SEVERITY not available")
 
-    return compute_area_stats(severity, roi)
+    return severity
 
 
 @register(Dependency.RBR_AREA_STATISTICS)
 def compute_rbr_area_statistics(context):
-    rbr = context.get(Dependency.RBR)
-    roi = context.inputs["roi"]
-
-    if rbr is None:
-        raise RuntimeError("RBR not available")
+    """
+    Provide the classified RBR severity for area statistics.
 
-    severity = (
-        ee.Image(0)
-        .where(rbr.gte(0.10).And(rbr.lt(0.27)), 1)
-        .where(rbr.gte(0.27).And(rbr.lt(0.44)), 2)
-        .where(rbr.gte(0.44).And(rbr.lt(0.66)), 3)
-        .where(rbr.gte(0.66), 4)
-        .rename("severity")
-        .toInt8()
-    )
+    Areas are resolved later, together with the other requested
+    statistics, by compute_area_stats().
+    """
+    severity = context.get(Dependency.RBR_SEVERITY)
+    if severity is None:
+        raise RuntimeError("RBR_SEVERITY not available")
 
-    return compute_area_stats(severity, roi)
+    return severity
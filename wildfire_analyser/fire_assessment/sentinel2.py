@@ -12,6 +12,13 @@
 # - Apply spatial and metadata-based filtering.
 # - Normalize reflectance bands for downstream processing.
 #
+# Design notes:
+# - Reflectance scaling is a per-pixel linear transform and commutes with
+#   mosaicking, so it is applied once to the final mosaic rather than
+#   mapped over every scene in the collection. Output band names are
+#   derived client-side from SPECTRAL_BANDS, keeping the graph free of
+#   server-side list operations.
+#
 # Copyright (C) 2025
 # Marcelo Camargo.
 #
@@ -23,11 +30,16 @@ import ee
 
 COLLECTION_ID = "COPERNICUS/S2_SR_HARMONIZED"
 
+# Spectral bands consumed by the pipeline (RGB, NDVI and NBR).
+SPECTRAL_BANDS = ["B2", "B3", "B4", "B8", "B12"]
+
+# Scene classification and cloud probability bands used for masking.
+QA_BANDS = ["SCL", "MSK_CLDPRB"]
+
 
-def _add_reflectance_bands(image: ee.Image) -> ee.Image:
-    bands = ["B2", "B3", "B4", "B8", "B12"]
-    refl = image.select(bands).multiply(0.0001)
-    refl_names = refl.bandNames().map(lambda b: ee.String(b).cat("_refl"))
+def add_reflectance_bands(image: ee.Image) -> ee.Image:
+    refl = image.select(SPECTRAL_BANDS).multiply(0.0001)
+    refl_names = [f"{band}_refl" for band in SPECTRAL_BANDS]
     return image.addBands(refl.rename(refl_names))
 
 
@@ -38,10 +50,8 @@ def gather_collection(
     Load Sentinel-2 SR collection.
     - Select dataset
     - Filter by ROI
-    - Add normalized reflectance bands
     """
     return (
         ee.ImageCollection(COLLECTION_ID)
         .filterBounds(roi)
-        .map(_add_reflectance_bands)
     )
@@ -0,0 +1,73 @@
+# SPDX-License-Identifier: MIT
+#
+# Burn severity classification helpers.
+#
+# This module defines the discrete burn severity classifiers shared by the
+# statistical and visual deliverables. Keeping a single definition per index
+# guarantees that area statistics and severity maps are derived from exactly
+# the same classification.
+#
+# Design notes:
+# - Classes follow the paper-style convention: 0 = Unburned, 1 = Low,
+#   2 = Moderate, 3 = High, 4 = Very High.
+# - Contiguous thresholds (dNBR, RBR) are applied as an ascending cascade of
+#   where() calls on a zero image, one comparison per threshold: each class
+#   overwrites the previous one, so no range (And) tests are needed. This
+#   yields a smaller graph than a nested ternary expression.
+# - Masked input pixels are reported as Unburned, since where() leaves the
+#   zero base untouched wherever the test is masked.
+#
+# Responsibilities of this module:
+# - Map continuous severity indices (dNBR, dNDVI, RBR) to discrete integer
+#   classes.
+#
+# Copyright (C) 2025
+# Marcelo Camargo.
+#
+# This file is part of wildfire-analyser and is distributed under the terms
+# of the MIT license. See the LICENSE file for details.
+
+
+import ee
+
+# Lower bounds of the Low, Moderate, High and Very High classes.
+DNBR_THRESHOLDS = (0.10, 0.27, 0.44, 0.66)
+RBR_THRESHOLDS = (0.10, 0.27, 0.44, 0.66)
+
+
+def classify_dnbr_severity(dnbr: ee.Image) -> ee.Image:
+    """
+    Classify continuous dNBR values into discrete severity classes.
+    """
+    return _classify_ascending(dnbr, DNBR_THRESHOLDS)
+
+
+def classify_dndvi_severity(dndvi: ee.Image) -> ee.Image:
+    """
+    Classify continuous dNDVI values into discrete severity classes.
+    """
+    return (
+        ee.Image(0)  # Unburned: dNDVI < 0.07
+        .where(dndvi.gte(0.07).And(dndvi.lt(0.10)), 1)   # Low
+        .where(dndvi.gte(0.10).And(dndvi.lt(0.20)), 1)  # Low
+        .where(dndvi.gte(0.20).And(dndvi.lt(0.33)), 2)  # Moderate
+        .where(dndvi.gte(0.33).And(dndvi.lt(0.44)), 3)  # High
+        .where(dndvi.gte(0.45), 4)                      # Very High
+        .rename("severity")
+        .toInt8()
+    )
+
+
+def classify_rbr_severity(rbr: ee.Image) -> ee.Image:
+    """
+    Classify continuous RBR values into discrete severity classes.
+    """
+    return _classify_ascending(rbr, RBR_THRESHOLDS)
+
+
+def _classify_ascending(image: ee.Image, thresholds) -> ee.Image:
+    classified = ee.Image(0)  # Unburned
+    for severity_class, threshold in enumerate(thresholds, start=1):
+        classified = classified.where(image.gte(threshold), severity_class)
+
+    return classified.rename("severity").toInt8()
@@ -11,6 +11,8 @@
 # - Time windows are computed inclusively to avoid off-by-one errors.
 # - Buffer periods are applied symmetrically around the event interval.
 # - All dates are normalized to ISO 8601 (YYYY-MM-DD) string format.
+# - Window computation is a pure function of its inputs and is memoized,
+#   since both the pre- and post-fire collection builders request it.
 #
 # Responsibilities of this module:
 # - Compute analysis time windows relative to fire events.
@@ -24,24 +26,26 @@
 
 
 import logging
-from datetime import datetime, timedelta
+from datetime import date, timedelta
+from functools import lru_cache
 
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=256)
 def compute_fire_time_windows(
     start_date: str,
     end_date: str,
     buffer_days: int,
 ) -> tuple[str, str, str, str]:
-    sd = datetime.strptime(start_date, "%Y-%m-%d")
-    ed = datetime.strptime(end_date, "%Y-%m-%d")
+    sd = date.fromisoformat(start_date)
+    ed = date.fromisoformat(end_date)
 
-    before_start = (sd - timedelta(days=buffer_days)).strftime("%Y-%m-%d")
-    before_end = (sd + timedelta(days=1)).strftime("%Y-%m-%d")  # INCLUI sd
+    before_start = (sd - timedelta(days=buffer_days)).isoformat()
+    before_end = (sd + timedelta(days=1)).isoformat()  # INCLUI sd
 
-    after_start = ed.strftime("%Y-%m-%d")
+    after_start = ed.isoformat()
     after_end = (ed + timedelta(days=buffer_days + 1)
-                 ).strftime("%Y-%m-%d")  # INCLUI ed
+                 ).isoformat()  # INCLUI ed
 
     return before_start, before_end, after_start, after_end
@@ -8,14 +8,16 @@
 #
 # Design notes:
 # - Classification is performed using discrete integer classes to match
-#   scientific reporting conventions.
+#   scientific reporting conventions. The classes are computed once by the
+#   DNBR_SEVERITY dependency and shared with the area statistics; this
+#   renderer only applies the palette.
 # - Visualization is strictly separated from scientific computation; this
 #   renderer does not alter the original continuous dNBR values.
 # - The region of interest (ROI) is overlaid as a vector outline to provide
 #   spatial context without masking surrounding areas.
 #
 # Responsibilities of this module:
-# - Classify continuous dNBR values into discrete severity classes.
+# - Render the discrete dNBR severity classes.
 # - Apply a standardized burn severity color palette.
 # - Overlay the ROI boundary for contextual visualization.
 # - Return an Earth Engine Image suitable for thumbnail generation.
@@ -30,16 +32,8 @@
 import ee
 
 def dnbr_visual(image: ee.Image, roi: ee.Geometry) -> ee.Image:
-    # Classificação discreta (paper-style)
-    classified = (
-        ee.Image(0)  # Unburned
-        .where(image.gte(0.10).And(image.lt(0.27)), 1)  # Low
-        .where(image.gte(0.27).And(image.lt(0.44)), 2)  # Moderate
-        .where(image.gte(0.44).And(image.lt(0.66)), 3)  # High
-        .where(image.gte(0.66), 4)                      # Very High
-    )
-
-    styled = classified.visualize(
+    # image: classificação discreta (paper-style) de DNBR_SEVERITY
+    styled = image.visualize(
         min=0.0,
         max=4.0,
         palette=[
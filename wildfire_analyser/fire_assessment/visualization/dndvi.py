@@ -8,14 +8,16 @@
 #
 # Design notes:
 # - Continuous dNDVI values are mapped to discrete integer severity classes
-#   to support consistent visual interpretation and reporting.
+#   to support consistent visual interpretation and reporting. The classes
+#   are computed once by the DNDVI_SEVERITY dependency and shared with the
+#   area statistics; this renderer only applies the palette.
 # - Visualization logic is strictly separated from scientific computation;
 #   this renderer does not modify or validate the underlying dNDVI data.
 # - The region of interest (ROI) is rendered as a vector outline to provide
 #   spatial context while preserving surrounding imagery.
 #
 # Responsibilities of this module:
-# - Classify continuous dNDVI values into discrete severity classes.
+# - Render the discrete dNDVI severity classes.
 # - Apply a fixed burn severity color palette.
 # - Overlay the ROI boundary for contextual visualization.
 # - Return an Earth Engine Image suitable for thumbnail generation.
@@ -31,16 +33,8 @@ import ee
 
 
 def dndvi_visual(image: ee.Image, roi: ee.Geometry) -> ee.Image:
-    # Tabela 5 — dNDVI (paper)
-    classified = (
-        ee.Image(0)  # Unburned (< 0.07)
-        .where(image.gte(0.10).And(image.lt(0.20)), 1)   # Low
-        .where(image.gte(0.20).And(image.lt(0.33)), 2)   # Moderate
-        .where(image.gte(0.33).And(image.lt(0.44)), 3)   # High
-        .where(image.gte(0.45), 4)                       # Very High
-    )
-
-    styled = classified.visualize(
+    # image: Tabela 5 — dNDVI (paper), classes de DNDVI_SEVERITY
+    styled = image.visualize(
         min=0,
         max=4,
         palette=[
@@ -9,14 +9,16 @@
 #
 # Design notes:
 # - Continuous RBR values are mapped to discrete integer severity classes to
-#   support consistent visual interpretation and reporting.
+#   support consistent visual interpretation and reporting. The classes are
+#   computed once by the RBR_SEVERITY dependency and shared with the area
+#   statistics; this renderer only applies the palette.
 # - Visualization logic is strictly separated from scientific computation;
 #   this renderer does not modify or validate the underlying RBR data.
 # - The region of interest (ROI) is rendered as a vector outline to provide
 #   spatial context while preserving surrounding imagery.
 #
 # Responsibilities of this module:
-# - Classify continuous RBR values into discrete severity classes.
+# - Render the discrete RBR severity classes.
 # - Apply a fixed burn severity color palette.
 # - Overlay the ROI boundary for contextual visualization.
 # - Return an Earth Engine Image suitable for thumbnail generation.
@@ -32,16 +34,8 @@ import ee
 
 
 def rbr_visual(image: ee.Image, roi: ee.Geometry) -> ee.Image:
-    # Classificação por faixas (paper-style)
-    classified = (
-        ee.Image(0)  # Unburned
-        .where(image.gte(0.10).And(image.lt(0.27)), 1)   # Low
-        .where(image.gte(0.27).And(image.lt(0.44)), 2)  # Moderate
-        .where(image.gte(0.44).And(image.lt(0.66)), 3)  # High
-        .where(image.gte(0.66), 4)                      # Very High
-    )
-
-    styled = classified.visualize(
+    # image: classificação por faixas (paper-style) de RBR_SEVERITY
+    styled = image.visualize(
         min=0,
         max=4,
         palette=[
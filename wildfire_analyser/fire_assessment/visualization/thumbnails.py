@@ -11,14 +11,16 @@
 # - Earth Engine objects are evaluated lazily until getThumbURL() is called.
 # - Thumbnail generation triggers server-side execution but returns
 #   immediately with a signed URL.
-# - Images are clipped to the bounding box of the region of interest (ROI)
-#   to preserve spatial context while limiting request size.
+# - Thumbnails are rendered over the bounding box of the region of interest
+#   (ROI) to preserve spatial context while limiting request size. The box
+#   is passed as the render region rather than via clip(), so no
+#   intermediate clipped image is materialized before encoding.
 # - Fixed dimensions are used instead of scale to avoid Earth Engine pixel
 #   grid and request size limitations.
 #
 # Responsibilities of this module:
 # - Generate stable thumbnail URLs for visual deliverables.
-# - Apply spatial clipping to the ROI bounding box.
+# - Restrict rendering to the ROI bounding box.
 # - Define thumbnail rendering parameters (dimensions, format).
 #
 # Copyright (C) 2025
@@ -35,8 +37,8 @@ def get_visual_thumbnail_url(
     image: ee.Image,
     roi: ee.Geometry,
 ) -> str:
-    image = image.clip(roi.bounds())
     return image.getThumbURL({
+        "region": roi.bounds(),
         "dimensions": 1024,
         "format": "jpg",
     })